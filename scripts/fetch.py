@@ -8,28 +8,100 @@ writes markdown to fetch/output/ with timestamp-prefixed filenames.
 Falls back to Playwright for JS-heavy sites (Claude/ChatGPT shares).
 """
 
+import asyncio
+import codecs
+import hashlib
 import json
 import os
 import re
 import sys
-import urllib.request
-import urllib.error
-from datetime import datetime, timezone
+from collections import defaultdict
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse, quote
 
+import aiohttp
+
+# Optional: faster JSON parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: Aho-Corasick automaton for single-pass multi-pattern scans
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 QUEUE_DIR = Path("fetch/queue")
 OUTPUT_DIR = Path("fetch/output")
+CACHE_DIR = Path("fetch/.cache")
 JINA_READER_PREFIX = "https://r.jina.ai/"
 
-# URLs that require JavaScript rendering
-JS_REQUIRED_PATTERNS = [
-    r"claude\.ai/share/",
-    r"chatgpt\.com/share/",
-    r"chat\.openai\.com/share/",
+# Max Jina requests in flight at once (avoids rate limiting)
+JINA_CONCURRENCY = 10
+
+# Pooled connections kept open to the Jina host, and DNS cache lifetime (seconds)
+HTTP_POOL_SIZE = 16
+HTTP_DNS_CACHE_TTL = 300
+
+# Jina responses are read in chunks of this size, and rejected past the cap
+JINA_CHUNK_BYTES = 8192
+JINA_MAX_BODY_BYTES = 5 * 1024 * 1024
+
+# Successful Jina results are reused for this long, and the cache is
+# trimmed (least recently used first) to stay under the size cap
+CACHE_TTL = timedelta(hours=24)
+CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+# Persistent Chromium profile, so the HTTP cache survives between runs.
+# Bump the version to start from a clean profile (CI caches it by this path).
+PLAYWRIGHT_PROFILE_VERSION = 1
+PLAYWRIGHT_PROFILE_DIR = Path.home() / ".cache" / "zoehq-fetch" / f"chromium-v{PLAYWRIGHT_PROFILE_VERSION}"
+
+# Requests never needed to extract page text: images, fonts, media and
+# third-party analytics. Stylesheets stay, since innerText depends on
+# layout (CSS-hidden menus and modals would otherwise leak into the text).
+BLOCKED_FILE_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "ico", "svg",
+    "woff", "woff2", "ttf", "otf", "eot",
+    "mp4", "webm", "mp3", "m4a", "ogg", "wav",
+)
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "segment.com",
+    "segment.io",
+    "hotjar.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "sentry.io",
+    "intercom.io",
+    "datadoghq.com",
+    "statsig.com",
+)
+BLOCKED_URL_PATTERNS = [
+    *(f"*.{ext}{suffix}" for ext in BLOCKED_FILE_EXTENSIONS for suffix in ("", "?*")),
+    *(f"*{host}/*" for host in BLOCKED_HOSTS),
 ]
 
+HTTP_HEADERS = {
+    "User-Agent": "ZoeHQ-Fetch/1.0",
+    "Accept": "text/plain",
+}
+
+# URLs that require JavaScript rendering (plain substrings, not regexes)
+JS_REQUIRED_PATTERNS = (
+    "claude.ai/share/",
+    "chatgpt.com/share/",
+    "chat.openai.com/share/",
+)
+
 # Content patterns that indicate we got a login page instead of real content
 LOGIN_PAGE_INDICATORS = [
     "Continue with Google",
@@ -39,6 +111,12 @@ LOGIN_PAGE_INDICATORS = [
     "Create an account",
 ]
 
+# Line start of a markdown heading; candidates for the page title
+HEADING_MARKER = "\n#"
+
+# Text carried between streamed chunks so a marker split across them still matches
+_SCAN_OVERLAP_CHARS = max(len(marker) for marker in (*LOGIN_PAGE_INDICATORS, HEADING_MARKER)) - 1
+
 # Cloudflare challenge indicators
 CLOUDFLARE_INDICATORS = [
     "Just a moment...",
@@ -49,6 +127,67 @@ CLOUDFLARE_INDICATORS = [
     "cloudflare",
 ]
 
+# Challenge pages are short; indicators only ever appear this early in the page
+CLOUDFLARE_SCAN_CHARS = 4096
+
+# Lowercased once here rather than on every check
+_CF_LC = tuple(indicator.lower() for indicator in CLOUDFLARE_INDICATORS)
+
+# Precompiled patterns (built once at import, not per call)
+# List line; [^\S\n] is \s within a single line, and the outer [^\S\n]*
+# (plus the note starting/ending on non-space) stand in for line.strip()
+_LIST_RE = re.compile(
+    r"^[^\S\n]*[-*][^\S\n]+(https?://\S+)(?:[^\S\n]+[—–-][^\S\n]+(\S.*?))?[^\S\n]*$",
+    re.MULTILINE,
+)
+_URL_LINE_RE = re.compile(r"^https?://\S+$")
+_URL_RE = re.compile(r"https?://\S+")
+_TITLE_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_HEADING_MARKER_RE = re.compile(re.escape(HEADING_MARKER))
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_SPACES = re.compile(r"[-\s]+")
+_SLUG_DASHES = re.compile(r"-+")
+
+# ASCII slugify table: same result as _SLUG_STRIP + _SLUG_SPACES, in one
+# translate. Whitespace becomes "-"; everything else that is not a word
+# character or "-" (punctuation, control chars) is dropped.
+_SLUG_TABLE = str.maketrans({
+    c: ("-" if c.isspace() else None)
+    for c in map(chr, range(128))
+    if not (c.isalnum() or c in "_-")
+})
+
+
+def _build_automaton(entries) -> "ahocorasick.Automaton":
+    """Build an Aho-Corasick automaton from (word, payload) pairs."""
+    automaton = ahocorasick.Automaton()
+    for word, payload in entries:
+        automaton.add_word(word, payload)
+    automaton.make_automaton()
+    return automaton
+
+
+# Indicator automatons: one pass over the page finds every indicator.
+# _SCAN_AC finds login indicators and heading line starts together.
+if ahocorasick is not None:
+    _SCAN_AC = _build_automaton(
+        [(indicator, "login") for indicator in LOGIN_PAGE_INDICATORS]
+        + [(HEADING_MARKER, "heading")]
+    )
+    _CF_AC = _build_automaton((indicator, indicator) for indicator in _CF_LC)
+else:
+    _SCAN_AC = _CF_AC = None
+
+
+def _loads(data):
+    """Parse JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity, which only the stdlib parser accepts
+    return json.loads(data)
+
 
 def parse_input_file(content: str) -> list[dict]:
     """
@@ -67,42 +206,37 @@ def parse_input_file(content: str) -> list[dict]:
     # Try JSON first
     if content.startswith("{") or content.startswith("["):
         try:
-            data = json.loads(content)
+            data = _loads(content)
             if isinstance(data, dict):
                 return [{"url": data.get("url", ""), "note": data.get("note", "")}]
             elif isinstance(data, list):
                 return [{"url": item.get("url", ""), "note": item.get("note", "")} for item in data]
-        except json.JSONDecodeError:
+        except ValueError:  # json/orjson JSONDecodeError
             pass  # Fall through to other formats
 
     # Check for markdown list format (lines starting with "- http")
-    lines = content.split("\n")
-    list_pattern = re.compile(r"^[-*]\s+(https?://\S+)(?:\s+[—–-]\s+(.*))?$")
-
-    list_items = []
-    for line in lines:
-        match = list_pattern.match(line.strip())
-        if match:
-            list_items.append({"url": match.group(1), "note": match.group(2) or ""})
+    # One pass over the whole content, no intermediate list of lines
+    list_items = [
+        {"url": match.group(1), "note": match.group(2) or ""}
+        for match in _LIST_RE.finditer(content)
+    ]
 
     if list_items:
         return list_items
 
     # Single URL or URL with note
     # First non-empty line should be URL
-    url_pattern = re.compile(r"^https?://\S+$")
-
     parts = content.split("\n\n", 1)
     first_part = parts[0].strip()
 
     # Check if first line is a URL
     first_line = first_part.split("\n")[0].strip()
-    if url_pattern.match(first_line):
+    if _URL_LINE_RE.match(first_line):
         note = parts[1].strip() if len(parts) > 1 else ""
         return [{"url": first_line, "note": note}]
 
     # Try to find any URL in the content
-    url_match = re.search(r"https?://\S+", content)
+    url_match = _URL_RE.search(content)
     if url_match:
         return [{"url": url_match.group(0), "note": ""}]
 
@@ -111,85 +245,198 @@ def parse_input_file(content: str) -> list[dict]:
 
 def needs_js_rendering(url: str) -> bool:
     """Check if URL requires JavaScript rendering."""
-    for pattern in JS_REQUIRED_PATTERNS:
-        if re.search(pattern, url):
-            return True
-    return False
+    return any(pattern in url for pattern in JS_REQUIRED_PATTERNS)
 
 
 def is_login_page(content: str) -> bool:
     """Check if content appears to be a login page instead of real content."""
-    for indicator in LOGIN_PAGE_INDICATORS:
-        if indicator in content:
-            return True
+    return any(indicator in content for indicator in LOGIN_PAGE_INDICATORS)
+
+
+def scan_markers(text: str, offset: int, headings: list[int]) -> bool:
+    """
+    Scan text once for login indicators and heading line starts.
+
+    text starts at position offset of the full content. Positions of
+    newly seen heading candidates (the "#") are appended to headings.
+    Returns True as soon as a login indicator is found.
+    """
+    if _SCAN_AC is not None:
+        for end, kind in _SCAN_AC.iter(text):
+            if kind == "login":
+                return True
+            pos = offset + end
+            if not headings or pos > headings[-1]:
+                headings.append(pos)
+        return False
+
+    if is_login_page(text):
+        return True
+    for match in _HEADING_MARKER_RE.finditer(text):
+        pos = offset + match.end() - 1
+        if not headings or pos > headings[-1]:
+            headings.append(pos)
     return False
 
 
+def first_heading(content: str, headings: list[int]) -> str:
+    """Get the text of the first "# " heading among candidate positions."""
+    for pos in headings:
+        match = _TITLE_RE.match(content, pos)
+        if match:
+            return match.group(1).strip()
+    return ""
+
+
 def is_cloudflare_challenge(content: str) -> bool:
     """Check if content is a Cloudflare challenge page."""
-    content_lower = content.lower()
-    matches = sum(1 for indicator in CLOUDFLARE_INDICATORS if indicator.lower() in content_lower)
+    # Only the start of the page matters, so avoid lowercasing all of it
+    head = content[:CLOUDFLARE_SCAN_CHARS].lower()
+    if "cloudflare" not in head and "ray id:" not in head:
+        return False
+
+    if _CF_AC is not None:
+        # Need at least 2 distinct indicators to confirm it's Cloudflare
+        seen = set()
+        for _, indicator in _CF_AC.iter_long(head):
+            seen.add(indicator)
+            if len(seen) >= 2:
+                return True
+        return False
+
     # Need at least 2 indicators to confirm it's Cloudflare
-    return matches >= 2
+    hits = 0
+    for indicator in _CF_LC:
+        if indicator in head:
+            hits += 1
+            if hits >= 2:
+                return True
+    return False
 
 
-def fetch_via_jina(url: str) -> dict:
+def make_session() -> aiohttp.ClientSession:
+    """
+    Create the HTTP session shared by all Jina requests in a run.
+
+    Connections (and their TLS handshakes) and DNS lookups are pooled
+    and reused across URLs, since every request hits the same host.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, ttl_dns_cache=HTTP_DNS_CACHE_TTL),
+        headers=HTTP_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+
+
+async def warm_up(session):
+    """
+    Open a pooled connection (DNS + TLS) to the Jina host ahead of real requests.
+
+    Start it as a task while local work (queue reading, cache lookups)
+    runs, and hand it to fetch_urls, whose first Jina request waits for
+    it so that request reuses the connection instead of opening another.
+    """
+    try:
+        async with session.head(JINA_READER_PREFIX, timeout=aiohttp.ClientTimeout(total=2)):
+            pass
+    except Exception:
+        pass  # Best effort: the first real request connects on its own
+
+
+async def fetch_via_jina(session, semaphore, url: str) -> dict:
     """
     Fetch URL content via Jina Reader.
 
+    Concurrency across calls is bounded by semaphore. The body is
+    streamed and the download abandoned as soon as it looks like a
+    login page or grows past JINA_MAX_BODY_BYTES.
     Returns dict with success, title, content, error.
     """
     jina_url = JINA_READER_PREFIX + url
+    too_large = {
+        "success": False,
+        "title": "",
+        "content": "",
+        "error": f"Response larger than {JINA_MAX_BODY_BYTES} bytes"
+    }
 
     try:
-        req = urllib.request.Request(
-            jina_url,
-            headers={
-                "User-Agent": "ZoeHQ-Fetch/1.0",
-                "Accept": "text/plain",
-            }
-        )
-        with urllib.request.urlopen(req, timeout=30) as response:
-            content = response.read().decode("utf-8")
-
-            # Check if we got a login page instead of real content
-            if is_login_page(content):
-                return {
-                    "success": False,
-                    "title": "",
-                    "content": "",
-                    "error": "Got login page instead of content (JS rendering required)"
-                }
-
-            # Jina Reader returns markdown with title as first # heading
-            title = ""
-            title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-            if title_match:
-                title = title_match.group(1).strip()
-            else:
-                # Fallback: use domain as title
-                parsed = urlparse(url)
-                title = parsed.netloc
+        async with semaphore:
+            async with session.get(jina_url) as response:
+                response.raise_for_status()
+
+                if (response.content_length or 0) > JINA_MAX_BODY_BYTES:
+                    response.close()
+                    return too_large
+
+                decoder = codecs.getincrementaldecoder("utf-8")()
+                parts = []
+                size = 0
+                headings = []
+                # Leading newline lets a heading on the first line match
+                # like any other line start; window_start is its position
+                tail = "\n"
+                window_start = -1
+                async for chunk in response.content.iter_chunked(JINA_CHUNK_BYTES):
+                    size += len(chunk)
+                    if size > JINA_MAX_BODY_BYTES:
+                        response.close()
+                        return too_large
+
+                    text = decoder.decode(chunk)
+                    window = tail + text
+
+                    # Check if we got a login page instead of real content,
+                    # noting heading positions in the same pass
+                    if scan_markers(window, window_start, headings):
+                        response.close()
+                        return {
+                            "success": False,
+                            "title": "",
+                            "content": "",
+                            "error": "Got login page instead of content (JS rendering required)"
+                        }
+
+                    parts.append(text)
+                    tail = window[-_SCAN_OVERLAP_CHARS:]
+                    window_start += len(window) - len(tail)
+
+                parts.append(decoder.decode(b"", final=True))
+
+        content = "".join(parts)
+
+        # Jina Reader returns markdown with title as first # heading
+        title = first_heading(content, headings)
+        if not title:
+            # Fallback: use domain as title
+            title = _netloc(url)
 
-            return {
-                "success": True,
-                "title": title,
-                "content": content,
-                "error": None
-            }
-    except urllib.error.HTTPError as e:
+        return {
+            "success": True,
+            "title": title,
+            "content": content,
+            "error": None
+        }
+    except aiohttp.ClientResponseError as e:
         return {
             "success": False,
             "title": "",
             "content": "",
-            "error": f"HTTP {e.code}: {e.reason}"
+            "error": f"HTTP {e.status}: {e.message}"
         }
-    except urllib.error.URLError as e:
+    except aiohttp.ClientError as e:
         return {
             "success": False,
             "title": "",
             "content": "",
-            "error": f"URL Error: {e.reason}"
+            "error": f"URL Error: {e}"
+        }
+    except asyncio.TimeoutError:
+        return {
+            "success": False,
+            "title": "",
+            "content": "",
+            "error": "URL Error: timed out"
         }
     except Exception as e:
         return {
@@ -200,23 +447,16 @@ def fetch_via_jina(url: str) -> dict:
         }
 
 
-def fetch_via_playwright(url: str) -> dict:
+@asynccontextmanager
+async def playwright_context():
     """
-    Fetch URL content via Playwright (headless browser).
+    Launch one headless Chromium context shared by Playwright fetches.
 
-    Used for JS-heavy sites like Claude/ChatGPT shares.
-    Uses playwright-stealth to help bypass bot detection.
-    Returns dict with success, title, content, error.
+    Uses the persistent profile at PLAYWRIGHT_PROFILE_DIR, and
+    playwright-stealth to help bypass bot detection.
+    Raises ImportError if Playwright is not installed.
     """
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        return {
-            "success": False,
-            "title": "",
-            "content": "",
-            "error": "Playwright not installed. Run: pip install playwright && playwright install chromium"
-        }
+    from playwright.async_api import async_playwright
 
     # Try to import stealth plugin (v2.0+ API)
     try:
@@ -228,68 +468,90 @@ def fetch_via_playwright(url: str) -> dict:
         stealth = None
         print("    → playwright-stealth not available, using standard browser")
 
-    try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                viewport={"width": 1920, "height": 1080},
-                locale="en-US",
-                timezone_id="America/New_York",
-            )
+    PLAYWRIGHT_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+
+    async with async_playwright() as p:
+        context = await p.chromium.launch_persistent_context(
+            user_data_dir=PLAYWRIGHT_PROFILE_DIR,
+            headless=True,
+            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            viewport={"width": 1920, "height": 1080},
+            locale="en-US",
+            timezone_id="America/New_York",
+        )
+        try:
             # Apply stealth mode to context if available (v2.0+ API)
             if has_stealth:
-                stealth.apply_stealth_sync(context)
+                await stealth.apply_stealth_async(context)
                 print("    → Stealth mode applied")
 
-            page = context.new_page()
+            yield context
+        finally:
+            await context.close()
+
+
+async def fetch_via_playwright(context, url: str) -> dict:
+    """
+    Fetch URL content via Playwright (headless browser).
+
+    Used for JS-heavy sites like Claude/ChatGPT shares.
+    Each URL gets its own page on the shared context.
+    Returns dict with success, title, content, error.
+    """
+    try:
+        page = await context.new_page()
+        try:
+            # Block unneeded requests via CDP rather than page.route, which
+            # would disable the HTTP cache the persistent profile keeps
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("Network.enable")
+            await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
 
             # Different wait strategies based on URL
             # Claude/ChatGPT have persistent connections, so networkidle never fires
             if "claude.ai/share" in url:
-                page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                content, title = extract_claude_share(page)
+                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+                content, title = await extract_claude_share(page)
             elif "chatgpt.com/share" in url or "chat.openai.com/share" in url:
-                page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                content, title = extract_chatgpt_share(page)
+                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+                content, title = await extract_chatgpt_share(page)
             else:
                 # Generic: try networkidle for regular pages
-                page.goto(url, wait_until="networkidle", timeout=60000)
-                title = page.title()
-                content = page.content()
+                await page.goto(url, wait_until="networkidle", timeout=60000)
+                title = await page.title()
                 # Try to get main content
-                main = page.query_selector("main, article, .content, #content")
+                main = await page.query_selector("main, article, .content, #content")
                 if main:
-                    content = main.inner_text()
+                    content = await main.inner_text()
                 else:
-                    content = page.query_selector("body").inner_text()
-
-            browser.close()
-
-            if not content or len(content.strip()) < 100:
-                return {
-                    "success": False,
-                    "title": "",
-                    "content": "",
-                    "error": "Failed to extract meaningful content"
-                }
-
-            # Check for Cloudflare challenge page
-            if is_cloudflare_challenge(content) or title == "Just a moment...":
-                return {
-                    "success": False,
-                    "title": "",
-                    "content": "",
-                    "error": "Blocked by Cloudflare challenge (bot detection)"
-                }
+                    content = await (await page.query_selector("body")).inner_text()
+        finally:
+            await page.close()
 
+        if not content or len(content.strip()) < 100:
             return {
-                "success": True,
-                "title": title,
-                "content": content,
-                "error": None
+                "success": False,
+                "title": "",
+                "content": "",
+                "error": "Failed to extract meaningful content"
             }
 
+        # Check for Cloudflare challenge page
+        if is_cloudflare_challenge(content) or title == "Just a moment...":
+            return {
+                "success": False,
+                "title": "",
+                "content": "",
+                "error": "Blocked by Cloudflare challenge (bot detection)"
+            }
+
+        return {
+            "success": True,
+            "title": title,
+            "content": content,
+            "error": None
+        }
+
     except Exception as e:
         return {
             "success": False,
@@ -299,13 +561,24 @@ def fetch_via_playwright(url: str) -> dict:
         }
 
 
-def extract_claude_share(page) -> tuple[str, str]:
-    """Extract conversation content from Claude share page."""
-    import time
+# Collects {role, text} for every node of the first selector that matches
+# anything, in one round trip instead of one inner_text() call per node
+_EXTRACT_TURNS_JS = """(selectors) => {
+    for (const selector of selectors) {
+        const nodes = document.querySelectorAll(selector);
+        if (nodes.length) {
+            return Array.from(nodes, (node) => ({
+                role: node.getAttribute("data-message-author-role") || "",
+                text: node.innerText.trim(),
+            }));
+        }
+    }
+    return [];
+}"""
 
-    # Give the page time to render JS content
-    time.sleep(3)
 
+async def extract_claude_share(page) -> tuple[str, str]:
+    """Extract conversation content from Claude share page."""
     # Try multiple selector strategies for Claude's conversation
     selectors_to_try = [
         '[data-testid*="message"]',
@@ -317,15 +590,17 @@ def extract_claude_share(page) -> tuple[str, str]:
         'div[class*="prose"]',
     ]
 
-    # Wait for any conversation content to appear
-    for selector in selectors_to_try:
-        try:
-            page.wait_for_selector(selector, timeout=10000)
-            break
-        except:
-            continue
+    # Wait for conversation content to be visible (returns as soon as it renders)
+    try:
+        await page.wait_for_selector(
+            '[data-testid*="message"], [class*="ConversationItem"], div[class*="prose"]',
+            state="visible",
+            timeout=10000,
+        )
+    except Exception:
+        pass  # Fall through to main/body fallbacks below
 
-    title = page.title()
+    title = await page.title()
     if " - Claude" in title:
         title = title.replace(" - Claude", "").strip()
     if "Claude" == title:
@@ -335,37 +610,33 @@ def extract_claude_share(page) -> tuple[str, str]:
     messages = []
 
     # Try each selector
-    turns = []
-    for selector in selectors_to_try:
-        turns = page.query_selector_all(selector)
-        if turns:
-            break
+    turns = await page.evaluate(_EXTRACT_TURNS_JS, selectors_to_try)
 
     if not turns:
         # Fallback: get all text content from main area
-        main = page.query_selector("main")
+        main = await page.query_selector("main")
         if main:
-            text = main.inner_text()
+            text = await main.inner_text()
             # Clean up the text
             if text and len(text) > 100:
                 return f"# {title}\n\n{text}", title
 
         # Last resort: get body text
-        body = page.query_selector("body")
+        body = await page.query_selector("body")
         if body:
-            text = body.inner_text()
+            text = await body.inner_text()
             return f"# {title}\n\n{text}", title
 
     for turn in turns:
-        text = turn.inner_text().strip()
+        text = turn["text"]
         if text and len(text) > 10:  # Skip very short fragments
             messages.append(text)
 
     if not messages:
         # Fallback to main content
-        main = page.query_selector("main")
+        main = await page.query_selector("main")
         if main:
-            return f"# {title}\n\n{main.inner_text()}", title
+            return f"# {title}\n\n{await main.inner_text()}", title
 
     content = "\n\n---\n\n".join(messages)
 
@@ -375,12 +646,12 @@ def extract_claude_share(page) -> tuple[str, str]:
     return markdown, title
 
 
-def extract_chatgpt_share(page) -> tuple[str, str]:
+async def extract_chatgpt_share(page) -> tuple[str, str]:
     """Extract conversation content from ChatGPT share page."""
     # Wait for conversation to load
-    page.wait_for_selector('[class*="agent-turn"], [class*="user-turn"], [data-message-author-role]', timeout=30000)
+    await page.wait_for_selector('[class*="agent-turn"], [class*="user-turn"], [data-message-author-role]', timeout=30000)
 
-    title = page.title()
+    title = await page.title()
     if " | ChatGPT" in title:
         title = title.replace(" | ChatGPT", "").strip()
     if "ChatGPT - " in title:
@@ -390,17 +661,20 @@ def extract_chatgpt_share(page) -> tuple[str, str]:
     messages = []
 
     # Try different selectors for ChatGPT's conversation structure
-    turns = page.query_selector_all('[data-message-author-role], [class*="agent-turn"], [class*="user-turn"]')
+    turns = await page.evaluate(
+        _EXTRACT_TURNS_JS,
+        ['[data-message-author-role], [class*="agent-turn"], [class*="user-turn"]'],
+    )
 
     if not turns:
         # Fallback: get main content
-        main = page.query_selector("main")
+        main = await page.query_selector("main")
         if main:
-            return main.inner_text(), title
+            return await main.inner_text(), title
 
     for turn in turns:
-        role = turn.get_attribute("data-message-author-role") or ""
-        text = turn.inner_text().strip()
+        role = turn["role"]
+        text = turn["text"]
 
         if text:
             if role == "user":
@@ -418,38 +692,197 @@ def extract_chatgpt_share(page) -> tuple[str, str]:
     return markdown, title
 
 
-def fetch_url(url: str) -> dict:
+def cache_path(url: str) -> Path:
+    """Get the cache file for a URL."""
+    return CACHE_DIR / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+
+def read_cache(url: str) -> dict | None:
     """
-    Fetch URL content, using appropriate method.
+    Look up a cached Jina result for URL.
 
-    1. If URL needs JS rendering, use Playwright directly
-    2. Otherwise, try Jina Reader first
-    3. Fall back to Playwright if Jina returns login page
+    Returns result dict (as from fetch_via_jina), or None if there is
+    no entry younger than CACHE_TTL.
     """
-    # Check if URL requires JS rendering
-    if needs_js_rendering(url):
-        print(f"    → JS rendering required, using Playwright")
-        return fetch_via_playwright(url)
+    path = cache_path(url)
+    try:
+        entry = _loads(path.read_bytes())
+        fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        if datetime.now(timezone.utc) - fetched_at >= CACHE_TTL:
+            return None
+        # Mark as recently used for pruning
+        os.utime(path)
+        return {
+            "success": True,
+            "title": entry["title"],
+            "content": entry["content"],
+            "error": None
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # Missing or unreadable entry is a cache miss
 
-    # Try Jina Reader first
-    result = fetch_via_jina(url)
 
-    if result["success"]:
-        return result
+def write_cache(url: str, result: dict):
+    """Store a successful Jina result for URL (best effort)."""
+    entry = {
+        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "title": result["title"],
+        "content": result["content"],
+    }
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path(url).write_text(json.dumps(entry), encoding="utf-8")
+    except OSError as e:
+        print(f"    → Could not write cache for {url}: {e}")
+
+
+def prune_cache():
+    """Delete least recently used cache entries until under CACHE_MAX_BYTES."""
+    if not CACHE_DIR.is_dir():
+        return
+
+    entries = []
+    for path in CACHE_DIR.glob("*.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= CACHE_MAX_BYTES:
+            break
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            continue  # Cache is optional; leave what can't be removed
+        total -= size
 
-    # If Jina failed with login page indicator, try Playwright
-    if "login page" in result.get("error", "").lower() or "JS rendering" in result.get("error", ""):
-        print(f"    → Jina got login page, falling back to Playwright")
-        return fetch_via_playwright(url)
 
-    return result
+def needs_playwright_fallback(result: dict) -> bool:
+    """Check if a failed Jina result should be retried with Playwright."""
+    error = result.get("error") or ""
+    return "login page" in error.lower() or "JS rendering" in error
 
 
+async def fetch_urls(session, urls: list[str], warm_up_task=None) -> list[dict]:
+    """
+    Fetch URL contents, using appropriate method for each.
+
+    1. URLs needing JS rendering go straight to Playwright
+    2. All others are fetched concurrently via Jina Reader,
+       unless a recent result is cached
+    3. Fall back to Playwright where Jina returns a login page
+
+    Playwright fetches run one at a time on a single shared browser context.
+    Each distinct URL is fetched once, even if it appears several times.
+    The first Jina request waits for warm_up_task (see warm_up), if given.
+    Returns results in the same order as urls.
+    """
+    # Duplicates would all miss the cache at once and each hit the network
+    unique_urls = list(dict.fromkeys(urls))
+    results = [None] * len(unique_urls)
+    playwright_indices = []
+    jina_indices = []
+
+    for i, url in enumerate(unique_urls):
+        if needs_js_rendering(url):
+            print(f"    → JS rendering required, using Playwright: {url}")
+            playwright_indices.append(i)
+        else:
+            jina_indices.append(i)
+
+    semaphore = asyncio.Semaphore(JINA_CONCURRENCY)
+    pending_warm_up = warm_up_task
+
+    async def jina_fetch(url: str) -> dict:
+        nonlocal pending_warm_up
+
+        # Cache file I/O runs in worker threads so it overlaps with
+        # the other requests in flight instead of stalling them
+        cached = await asyncio.to_thread(read_cache, url)
+        if cached:
+            print(f"    → Using cached result: {url}")
+            return cached
+
+        # aiohttp won't share a connection that is still opening, so the
+        # first request waits for the warm-up to put one in the pool
+        if pending_warm_up is not None:
+            task, pending_warm_up = pending_warm_up, None
+            await task
+
+        result = await fetch_via_jina(session, semaphore, url)
+        if result["success"]:
+            await asyncio.to_thread(write_cache, url, result)
+        return result
+
+    # Try Jina Reader for everything else, all at once; this keeps
+    # running in the background while Playwright works through its URLs
+    jina_future = asyncio.gather(*(jina_fetch(unique_urls[i]) for i in jina_indices))
+
+    async with AsyncExitStack() as stack:
+        context = None
+
+        async def playwright_fetch(url: str) -> dict:
+            # Browser is started on first use and shared by the rest
+            nonlocal context
+            if context is None:
+                try:
+                    context = await stack.enter_async_context(playwright_context())
+                except ImportError:
+                    return {
+                        "success": False,
+                        "title": "",
+                        "content": "",
+                        "error": "Playwright not installed. Run: pip install playwright && playwright install chromium"
+                    }
+                except Exception as e:
+                    return {
+                        "success": False,
+                        "title": "",
+                        "content": "",
+                        "error": f"Playwright error: {str(e)}"
+                    }
+            return await fetch_via_playwright(context, url)
+
+        for i in playwright_indices:
+            results[i] = await playwright_fetch(unique_urls[i])
+
+        for i, result in zip(jina_indices, await jina_future):
+            # If Jina failed with login page indicator, try Playwright
+            if not result["success"] and needs_playwright_fallback(result):
+                print(f"    → Jina got login page, falling back to Playwright: {unique_urls[i]}")
+                result = await playwright_fetch(unique_urls[i])
+            results[i] = result
+
+    if warm_up_task is not None:
+        warm_up_task.cancel()  # Never needed (e.g. every URL was cached)
+
+    if jina_indices:
+        await asyncio.to_thread(prune_cache)
+
+    by_url = dict(zip(unique_urls, results))
+    return [by_url[url] for url in urls]
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Get the network location (domain) part of a URL."""
+    return urlparse(url).netloc
+
+
+@lru_cache(maxsize=4096)
 def slugify(text: str, max_length: int = 50) -> str:
     """Convert text to URL-friendly slug."""
+    if text.isascii():
+        slug = text.lower().translate(_SLUG_TABLE)
+        slug = _SLUG_DASHES.sub("-", slug).strip("-")
+        return slug[:max_length]
+
     # Remove non-alphanumeric chars, replace spaces with hyphens
-    slug = re.sub(r"[^\w\s-]", "", text.lower())
-    slug = re.sub(r"[-\s]+", "-", slug).strip("-")
+    slug = _SLUG_STRIP.sub("", text.lower())
+    slug = _SLUG_SPACES.sub("-", slug).strip("-")
     return slug[:max_length]
 
 
@@ -461,7 +894,7 @@ def write_output(url: str, title: str, content: str, note: str, timestamp: datet
     """
     # Create timestamp-prefixed filename
     ts_str = timestamp.strftime("%Y-%m-%dT%H%M%S")
-    title_slug = slugify(title) if title else slugify(urlparse(url).netloc)
+    title_slug = slugify(title) if title else slugify(_netloc(url))
     filename = f"{ts_str}-{title_slug}.md"
 
     # Build frontmatter
@@ -476,18 +909,20 @@ fetched_at: {timestamp.isoformat()}
         frontmatter += f'source_note: "{escaped_note}"\n'
     frontmatter += "---\n\n"
 
-    # Combine frontmatter and content
-    full_content = frontmatter + content
-
-    # Write file
+    # Write file: stream both parts to a temp file, then publish it
+    # atomically so an interrupted run never leaves a half-written file
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     output_path = OUTPUT_DIR / filename
-    output_path.write_text(full_content, encoding="utf-8")
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write(frontmatter)
+        f.write(content)
+    os.replace(tmp_path, output_path)
 
     return output_path
 
 
-def process_queue():
+async def process_queue():
     """Process all files in the queue directory."""
     if not QUEUE_DIR.exists():
         print(f"Queue directory {QUEUE_DIR} does not exist")
@@ -503,13 +938,25 @@ def process_queue():
     print(f"Found {len(queue_files)} file(s) in queue")
 
     results = {"success": 0, "failed": 0, "files_processed": []}
+    file_results = defaultdict(lambda: {"success": 0, "failed": 0})
 
-    for queue_file in queue_files:
-        print(f"\nProcessing: {queue_file.name}")
+    async with make_session() as session:
+        warm_up_task = None
 
-        try:
-            content = queue_file.read_text(encoding="utf-8")
-            urls = parse_input_file(content)
+        # Collect URLs from every queue file, so they can all be fetched together
+        parsed_files = []
+        work_items = []  # (queue_file, {url, note})
+
+        for queue_file in queue_files:
+            print(f"\nReading: {queue_file.name}")
+
+            try:
+                content = await asyncio.to_thread(queue_file.read_text, encoding="utf-8")
+                urls = parse_input_file(content)
+            except Exception as e:
+                print(f"  Error processing {queue_file.name}: {e}")
+                results["failed"] += 1
+                continue
 
             if not urls:
                 print(f"  No URLs found in {queue_file.name}")
@@ -517,49 +964,81 @@ def process_queue():
                 continue
 
             print(f"  Found {len(urls)} URL(s)")
+            parsed_files.append(queue_file)
 
-            for i, item in enumerate(urls):
-                url = item["url"]
-                note = item["note"]
-
-                if not url:
+            for item in urls:
+                if not item["url"]:
                     print(f"  Skipping empty URL")
                     continue
+                print(f"  Fetching: {item['url']}")
+                work_items.append((queue_file, item))
+
+                # Connect to Jina while the remaining queue files are read
+                if warm_up_task is None and not needs_js_rendering(item["url"]):
+                    warm_up_task = asyncio.create_task(warm_up(session))
+
+        # Fetch content (Jina first, Playwright fallback)
+        if work_items:
+            print(f"\nFetching {len(work_items)} URL(s)")
+            fetch_results = await fetch_urls(
+                session, [item["url"] for _, item in work_items], warm_up_task
+            )
+        else:
+            fetch_results = []
 
-                print(f"  Fetching: {url}")
-
-                # Fetch content (Jina first, Playwright fallback)
-                fetch_result = fetch_url(url)
-
-                if fetch_result["success"]:
-                    # Use slightly offset timestamps for multiple URLs
-                    timestamp = datetime.now(timezone.utc)
-                    if i > 0:
-                        # Add seconds offset for ordering
-                        from datetime import timedelta
-                        timestamp = timestamp + timedelta(seconds=i)
-
-                    output_path = write_output(
-                        url=url,
-                        title=fetch_result["title"],
-                        content=fetch_result["content"],
-                        note=note,
-                        timestamp=timestamp
-                    )
-                    print(f"  ✓ Written: {output_path.name}")
-                    results["success"] += 1
-                else:
-                    print(f"  ✗ Failed: {fetch_result['error']}")
-                    results["failed"] += 1
+    # Use slightly offset timestamps for multiple URLs, for ordering
+    base_timestamp = datetime.now(timezone.utc)
+    current_file = None
+
+    for i, ((queue_file, item), fetch_result) in enumerate(zip(work_items, fetch_results)):
+        if queue_file != current_file:
+            print(f"\nProcessing: {queue_file.name}")
+            current_file = queue_file
+
+        url = item["url"]
+        counts = file_results[queue_file]
+
+        if not fetch_result["success"]:
+            print(f"  ✗ Failed: {url}: {fetch_result['error']}")
+            counts["failed"] += 1
+            continue
+
+        try:
+            output_path = await asyncio.to_thread(
+                write_output,
+                url=url,
+                title=fetch_result["title"],
+                content=fetch_result["content"],
+                note=item["note"],
+                timestamp=base_timestamp + timedelta(seconds=i)
+            )
+        except Exception as e:
+            print(f"  ✗ Failed to write {url}: {e}")
+            counts["failed"] += 1
+            continue
+
+        print(f"  ✓ Written: {output_path.name}")
+        counts["success"] += 1
 
-            # Delete processed queue file
-            queue_file.unlink()
-            results["files_processed"].append(queue_file.name)
-            print(f"  Deleted: {queue_file.name}")
+    # Delete queue files only once every URL in them succeeded
+    print()
+    for queue_file in parsed_files:
+        counts = file_results[queue_file]
+        results["success"] += counts["success"]
+        results["failed"] += counts["failed"]
 
+        if counts["failed"]:
+            print(f"Kept: {queue_file.name} ({counts['failed']} URL(s) failed)")
+            continue
+
+        try:
+            await asyncio.to_thread(queue_file.unlink)
         except Exception as e:
-            print(f"  Error processing {queue_file.name}: {e}")
+            print(f"Error deleting {queue_file.name}: {e}")
             results["failed"] += 1
+            continue
+        results["files_processed"].append(queue_file.name)
+        print(f"Deleted: {queue_file.name}")
 
     print(f"\n--- Summary ---")
     print(f"URLs fetched: {results['success']}")
@@ -571,15 +1050,21 @@ def process_queue():
         sys.exit(1)
 
 
-def fetch_single_url(url: str, note: str = ""):
+async def fetch_single_url(url: str, note: str = ""):
     """Fetch a single URL (for manual/workflow dispatch)."""
     print(f"Fetching: {url}")
 
-    fetch_result = fetch_url(url)
+    async with make_session() as session:
+        # Connect to Jina while the cache is checked
+        warm_up_task = None
+        if not needs_js_rendering(url):
+            warm_up_task = asyncio.create_task(warm_up(session))
+        [fetch_result] = await fetch_urls(session, [url], warm_up_task)
 
     if fetch_result["success"]:
         timestamp = datetime.now(timezone.utc)
-        output_path = write_output(
+        output_path = await asyncio.to_thread(
+            write_output,
             url=url,
             title=fetch_result["title"],
             content=fetch_result["content"],
@@ -597,7 +1082,7 @@ if __name__ == "__main__":
         # Single URL mode (from workflow dispatch)
         url = sys.argv[1]
         note = sys.argv[2] if len(sys.argv) > 2 else ""
-        fetch_single_url(url, note)
+        asyncio.run(fetch_single_url(url, note))
     else:
         # Queue processing mode
-        process_queue()
+        asyncio.run(process_queue())